@@ -9,13 +9,20 @@ Bleed calculations (corrected):
 - Height: 3.47% (0.12" on each side for 3.46" safe area)
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
-from PIL import Image, ImageOps
+import numpy as np
+import PIL
+from PIL import Image
 import threading
 import time
-from typing import List, Tuple, Optional
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Iterator, List, Optional, Set, Tuple
 
 # Add readline support for input history
 try:
@@ -30,6 +37,10 @@ except ImportError:
     except ImportError:
         READLINE_AVAILABLE = False
 
+# Pillow-SIMD is a drop-in Pillow build with SIMD-accelerated routines;
+# its releases carry a ".postN" version suffix
+PILLOW_SIMD = '.post' in PIL.__version__
+
 class TerminalColors:
     """ANSI color codes for terminal output"""
     RESET = '\033[0m'
@@ -127,23 +138,38 @@ def get_folder_path(prompt: str, must_exist: bool = True, history=None) -> Path:
             
         return path
 
+def _walk_files(folder: Path, extensions: Set[str]) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield file entries under folder whose extension is in extensions.
+    
+    Uses os.scandir so file type checks come from the cached directory
+    entries instead of a stat call per path. Folders that cannot be read
+    (no permission, removed mid-scan, symlink loops, ...) are skipped.
+    """
+    stack = [folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions:
+                    yield entry
+
 def find_image_files(input_folder: Path) -> List[Path]:
     """Find all image files in the input folder"""
     image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
-    image_files = []
+    image_files = [Path(entry.path) for entry in _walk_files(input_folder, image_extensions)]
     
-    spinner = LoadingSpinner("Scanning for images")
-    spinner.start()
-    
-    try:
-        for file_path in input_folder.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in image_extensions:
-                image_files.append(file_path)
-    finally:
-        spinner.stop(f"Found {len(image_files)} image(s)")
+    print(f'{TerminalColors.GREEN}✓ Found {len(image_files)} image(s){TerminalColors.RESET}')
     
     return image_files
 
+@lru_cache(maxsize=64)
 def calculate_bleed_pixels(width: int, height: int) -> Tuple[int, int, int, int]:
     """
     Calculate bleed pixels for each side based on MPC requirements.
@@ -155,83 +181,139 @@ def calculate_bleed_pixels(width: int, height: int) -> Tuple[int, int, int, int]
     
     Returns: (top, bottom, left, right) pixels to add
     """
-    # Calculate bleed as percentage of safe area dimensions
-    # Horizontal bleed: 0.12" on each side = 0.12/2.48 = 4.84% of width
-    # Vertical bleed: 0.12" on each side = 0.12/3.46 = 3.47% of height
-    WIDTH_BLEED_PERCENT = 4.84   # 0.12" / 2.48" = 4.84%
-    HEIGHT_BLEED_PERCENT = 3.47  # 0.12" / 3.46" = 3.47%
+    # Calculate bleed as an exact fraction of safe area dimensions
+    # Horizontal bleed: 0.12" on each side = 0.12/2.48 (~4.84%) of width
+    # Vertical bleed: 0.12" on each side = 0.12/3.46 (~3.47%) of height
+    # Integer ratios avoid the drift of the pre-rounded percentages
+    H_NUM, H_DEN = 12, 248  # 0.12" / 2.48"
+    V_NUM, V_DEN = 12, 346  # 0.12" / 3.46"
     
     # Calculate bleed pixels for each side
-    horizontal_bleed_per_side = int((width * WIDTH_BLEED_PERCENT) / 100)
-    vertical_bleed_per_side = int((height * HEIGHT_BLEED_PERCENT) / 100)
+    horizontal_bleed_per_side = (width * H_NUM) // H_DEN
+    vertical_bleed_per_side = (height * V_NUM) // V_DEN
     
     # Return as (top, bottom, left, right)
     return vertical_bleed_per_side, vertical_bleed_per_side, horizontal_bleed_per_side, horizontal_bleed_per_side
 
-def add_bleed_border(image_path: Path, output_folder: Path) -> bool:
+def get_save_options(suffix: str, optimize: bool = False) -> dict:
+    """
+    Get encoder keyword arguments for saving an image with the given suffix.
+    
+    Fast encoder settings are used by default; optimize=True trades encode
+    time for smaller files (extra zlib/Huffman passes).
+    
+    Returns: keyword arguments for Image.save()
+    """
+    suffix = suffix.lower()
+    
+    if suffix == '.png':
+        if optimize:
+            return {'optimize': True}
+        return {'compress_level': 1}
+    
+    if suffix in ('.jpg', '.jpeg'):
+        return {'quality': 95, 'subsampling': 0, 'optimize': optimize}
+    
+    if suffix == '.webp':
+        return {'quality': 95, 'method': 6 if optimize else 0}
+    
+    return {}
+
+def load_rgb_array(image_path: Path) -> np.ndarray:
+    """
+    Decode an image into an RGB pixel array.
+    
+    The source image is closed before returning so only the array stays
+    in memory.
+    
+    Returns: (height, width, 3) uint8 array
+    """
+    with Image.open(image_path) as img:
+        # Convert to RGB if necessary (for PNG with transparency, etc.)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # Read the pixels as one raw RGB buffer and view it as an array
+        width, height = img.size
+        raw = img.tobytes('raw', 'RGB')
+        return np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 3)
+
+_thread_buffers = threading.local()
+
+def _get_output_buffer(height: int, width: int) -> np.ndarray:
+    """
+    Get a reusable (height, width, 3) uint8 buffer for the current thread.
+    
+    Cards in a batch almost always share one size, so the buffer is only
+    reallocated when the size changes. Its contents are not cleared.
+    
+    This only saves the np.empty call per image: Image.frombuffer still
+    copies 3-byte RGB data, and one full output frame stays allocated per
+    thread (including the main process) for the life of the process.
+    """
+    shape = (height, width, 3)
+    buffer = getattr(_thread_buffers, 'output', None)
+    if buffer is None or buffer.shape != shape:
+        buffer = np.empty(shape, dtype=np.uint8)
+        _thread_buffers.output = buffer
+    return buffer
+
+def add_bleed_border(image_path: Path, output_folder: Path, optimize: bool = False) -> bool:
     """
     Add bleed border to a single image by extending edge pixels outward.
     
     Returns: True if successful, False otherwise
     """
     try:
-        # Open the image
-        with Image.open(image_path) as img:
-            # Convert to RGB if necessary (for PNG with transparency, etc.)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            width, height = img.size
-            
-            # Calculate bleed pixels
-            top, bottom, left, right = calculate_bleed_pixels(width, height)
-            
-            # Create new image with extended dimensions
-            new_width = width + left + right
-            new_height = height + top + bottom
-            extended_img = Image.new('RGB', (new_width, new_height))
-            
-            # Paste the original image in the center
-            extended_img.paste(img, (left, top))
-            
-            # Extend edge pixels outward
-            # Top edge
-            if top > 0:
-                top_edge = img.crop((0, 0, width, 1))
-                for y in range(top):
-                    extended_img.paste(top_edge, (left, y))
-            
-            # Bottom edge
-            if bottom > 0:
-                bottom_edge = img.crop((0, height - 1, width, height))
-                for y in range(top + height, new_height):
-                    extended_img.paste(bottom_edge, (left, y))
-            
-            # Left edge (including corners)
-            if left > 0:
-                left_edge = extended_img.crop((left, 0, left + 1, new_height))
-                for x in range(left):
-                    extended_img.paste(left_edge, (x, 0))
-            
-            # Right edge (including corners)
-            if right > 0:
-                right_edge = extended_img.crop((left + width - 1, 0, left + width, new_height))
-                for x in range(left + width, new_width):
-                    extended_img.paste(right_edge, (x, 0))
-            
-            # Create output path
-            output_path = output_folder / image_path.name
-            
-            # Save the image
-            extended_img.save(output_path, quality=95, optimize=True)
-            
-            return True
-            
+        # Decode the image
+        arr = load_rgb_array(image_path)
+        height, width = arr.shape[:2]
+        
+        # Calculate bleed pixels
+        top, bottom, left, right = calculate_bleed_pixels(width, height)
+        
+        # Reuse this thread's output buffer; every pixel is overwritten below
+        new_width = width + left + right
+        new_height = height + top + bottom
+        out = _get_output_buffer(new_height, new_width)
+        
+        # Copy the original image into the center
+        out[top:top + height, left:left + width] = arr
+        
+        # Extend edge pixels outward
+        # Top edge
+        out[:top, left:left + width] = arr[0:1]
+        
+        # Bottom edge
+        out[top + height:, left:left + width] = arr[height - 1:height]
+        
+        # Left edge (including corners, taken from the filled top/bottom strips)
+        out[:, :left] = out[:, left:left + 1]
+        
+        # Right edge (including corners)
+        out[:, left + width:] = out[:, left + width - 1:left + width]
+        
+        # Release the source pixels before encoding
+        del arr
+        extended_img = Image.frombuffer('RGB', (new_width, new_height), out, 'raw', 'RGB', 0, 1)
+        
+        # Create output path
+        output_path = output_folder / image_path.name
+        
+        # Encode in memory and write the file in one go; the format is
+        # given explicitly since a buffer has no suffix to sniff
+        image_format = Image.registered_extensions()[image_path.suffix.lower()]
+        buffer = BytesIO()
+        extended_img.save(buffer, format=image_format, **get_save_options(image_path.suffix, optimize))
+        output_path.write_bytes(buffer.getbuffer())
+        
+        return True
+        
     except Exception as e:
         print(f"\n{TerminalColors.RED}Error processing {image_path.name}: {e}{TerminalColors.RESET}")
         return False
 
-def process_images(image_files: List[Path], output_folder: Path):
+def process_images(image_files: List[Path], output_folder: Path, optimize: bool = False):
     """Process all image files with progress tracking"""
     total_files = len(image_files)
     processed = 0
@@ -239,20 +321,54 @@ def process_images(image_files: List[Path], output_folder: Path):
     
     print(f"\n{TerminalColors.BOLD}Processing {total_files} image(s)...{TerminalColors.RESET}\n")
     
-    for i, image_path in enumerate(image_files, 1):
-        # Show progress
-        progress = (i / total_files) * 100
-        bar_length = 30
-        filled_length = int(bar_length * i // total_files)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        
-        print(f'\r{TerminalColors.BLUE}[{bar}] {progress:.1f}% - Processing: {image_path.name[:30]}...{TerminalColors.RESET}', end='', flush=True)
-        
-        # Process the image
-        if add_bleed_border(image_path, output_folder):
-            processed += 1
-        else:
-            failed += 1
+    # Each image is independent, so worker processes decode, pad and encode
+    # them in parallel while this process only tallies the results
+    worker = partial(add_bleed_border, output_folder=output_folder, optimize=optimize)
+    
+    # Redraw the progress bar at most 10 times per second
+    refresh_interval = 0.1
+    last_print = 0.0
+    
+    # Windows rejects more than 61 worker processes
+    workers = os.cpu_count() or 1
+    if sys.platform == 'win32':
+        workers = min(workers, 61)
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # One image per task keeps the progress bar and Ctrl+C per image;
+            # the IPC cost is tiny next to decoding and encoding a card
+            results = executor.map(worker, image_files)
+            
+            try:
+                for i, (image_path, success) in enumerate(zip(image_files, results), 1):
+                    # Tally the result
+                    if success:
+                        processed += 1
+                    else:
+                        failed += 1
+                    
+                    # Show progress, always including the final update
+                    now = time.monotonic()
+                    if now - last_print < refresh_interval and i != total_files:
+                        continue
+                    last_print = now
+                    
+                    progress = (i / total_files) * 100
+                    bar_length = 30
+                    filled_length = int(bar_length * i // total_files)
+                    bar = '█' * filled_length + '░' * (bar_length - filled_length)
+                    
+                    print(f'\r{TerminalColors.BLUE}[{bar}] {progress:.1f}% - Processed: {image_path.name[:30]}...{TerminalColors.RESET}', end='', flush=True)
+            except KeyboardInterrupt:
+                # Drop queued images instead of waiting for them on exit
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    except BrokenProcessPool as e:
+        # A worker died (e.g. out of memory on a huge scan); everything not
+        # yet tallied is counted as failed
+        failed = total_files - processed
+        print(f"\n{TerminalColors.RED}Image processing stopped unexpectedly: {e}{TerminalColors.RESET}")
     
     # Clear progress line and show summary
     print('\r' + ' ' * 80 + '\r', end='')
@@ -300,8 +416,20 @@ class InputHistory:
         if READLINE_AVAILABLE and text.strip():
             readline.add_history(text.strip())
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Add MPC print bleed borders to images.")
+    parser.add_argument(
+        '--optimize',
+        action='store_true',
+        help="spend extra encode time to produce smaller output files",
+    )
+    return parser.parse_args(argv)
+
 def main():
     """Main application function"""
+    args = parse_args()
+    
     # Initialize input history
     history = InputHistory()
     
@@ -315,6 +443,10 @@ def main():
         else:
             print(f"{TerminalColors.YELLOW}ℹ Install 'pyreadline3' for input history support{TerminalColors.RESET}")
         
+        # Show Pillow-SIMD status
+        if PILLOW_SIMD:
+            print(f"{TerminalColors.GREEN}✓ Pillow-SIMD {PIL.__version__} detected - SIMD-accelerated image processing enabled{TerminalColors.RESET}")
+        
         # Get input folder
         input_folder = get_folder_path("Enter the input folder path (containing images):", must_exist=True, history=history)
         
@@ -355,7 +487,7 @@ def main():
             return
         
         # Process images
-        process_images(image_files, output_folder)
+        process_images(image_files, output_folder, optimize=args.optimize)
         
         print(f"\n{TerminalColors.GREEN}{TerminalColors.BOLD}All done! 🎉{TerminalColors.RESET}")
         print(f"Check your output folder: {TerminalColors.CYAN}{output_folder}{TerminalColors.RESET}")
@@ -8,11 +8,20 @@ from PIL import Image
 import tempfile
 import sys
 import os
+from concurrent.futures.process import BrokenProcessPool
 
 # Add the parent directory to the path so we can import our module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from add_mpc_bleed import calculate_bleed_pixels, add_bleed_border
+import add_mpc_bleed
+from add_mpc_bleed import (
+    calculate_bleed_pixels,
+    add_bleed_border,
+    find_image_files,
+    get_save_options,
+    parse_args,
+    process_images,
+)
 
 
 class TestBleedCalculations:
@@ -38,6 +47,58 @@ class TestBleedCalculations:
         # Expected: 3.47% of 140 = 4.86 -> 4 pixels vertical per side
         assert left == right == 4
         assert top == bottom == 4
+    
+    def test_calculate_bleed_pixels_uses_exact_ratio(self):
+        """Test that bleed follows 0.12/2.48 exactly rather than a rounded 4.84%"""
+        width, height = 2500, 3500
+        top, bottom, left, right = calculate_bleed_pixels(width, height)
+        
+        # Expected: 2500 * 0.12 / 2.48 = 120.97 -> 120 (4.84% would give 121)
+        # Expected: 3500 * 0.12 / 3.46 = 121.39 -> 121
+        assert left == right == 120
+        assert top == bottom == 121
+
+
+class TestSaveOptions:
+    """Test format-specific encoder settings"""
+    
+    def test_png_uses_fast_compression(self):
+        """Test that PNG skips the slow optimize pass by default"""
+        assert get_save_options('.PNG') == {'compress_level': 1}
+        assert get_save_options('.png', optimize=True) == {'optimize': True}
+    
+    def test_jpeg_keeps_quality(self):
+        """Test that JPEG keeps high quality without an extra Huffman pass"""
+        options = get_save_options('.jpg')
+        assert options['quality'] == 95
+        assert options['optimize'] is False
+    
+    def test_other_formats_get_no_options(self):
+        """Test that formats without tuning get plain defaults"""
+        assert get_save_options('.bmp') == {}
+    
+    @pytest.mark.parametrize("suffix, image_format", [('.jpg', 'JPEG'), ('.webp', 'WEBP')])
+    @pytest.mark.parametrize("optimize", [False, True])
+    def test_add_bleed_border_encodes_lossy_formats(self, suffix, image_format, optimize):
+        """Test that the save options produce readable JPEG and WebP output"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            output_dir = temp_dir / "output"
+            output_dir.mkdir()
+            
+            input_path = temp_dir / f"card{suffix}"
+            Image.new('RGB', (100, 140), color=(0, 128, 255)).save(input_path)
+            
+            assert add_bleed_border(input_path, output_dir, optimize=optimize) is True
+            
+            with Image.open(output_dir / input_path.name) as output_img:
+                assert output_img.format == image_format
+                assert output_img.size == (108, 148)
+    
+    def test_parse_args_optimize_flag(self):
+        """Test that --optimize is off by default and can be enabled"""
+        assert parse_args([]).optimize is False
+        assert parse_args(['--optimize']).optimize is True
 
 
 class TestImageProcessing:
@@ -96,6 +157,197 @@ class TestImageProcessing:
                 # Top bleed area should have blue color (from top edge)
                 top_bleed_color = output_img.getpixel((50, 2))  # Middle of top bleed
                 assert top_bleed_color == (0, 0, 255)  # Blue
+    
+    def test_add_bleed_border_corners(self):
+        """Test that bleed corners are filled from the original corner pixels"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            
+            # Red image with a distinct color in each corner
+            test_image = Image.new('RGB', (100, 140), color=(255, 0, 0))
+            test_image.putpixel((0, 0), (0, 0, 255))  # Blue top-left
+            test_image.putpixel((99, 0), (0, 255, 0))  # Green top-right
+            test_image.putpixel((0, 139), (255, 255, 0))  # Yellow bottom-left
+            test_image.putpixel((99, 139), (255, 0, 255))  # Magenta bottom-right
+            
+            input_path = temp_dir / "corners.png"
+            test_image.save(input_path)
+            
+            output_dir = temp_dir / "output"
+            output_dir.mkdir()
+            
+            assert add_bleed_border(input_path, output_dir) is True
+            
+            with Image.open(output_dir / "corners.png") as output_img:
+                # No black pixels should be left in the corner bleed areas
+                assert output_img.getpixel((0, 0)) == (0, 0, 255)
+                assert output_img.getpixel((107, 0)) == (0, 255, 0)
+                assert output_img.getpixel((0, 147)) == (255, 255, 0)
+                assert output_img.getpixel((107, 147)) == (255, 0, 255)
+    
+    def test_add_bleed_border_reused_buffer(self):
+        """Test that consecutive same-sized images do not leak pixels into each other"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            output_dir = temp_dir / "output"
+            output_dir.mkdir()
+            
+            first_path = temp_dir / "first.png"
+            second_path = temp_dir / "second.png"
+            Image.new('RGB', (100, 140), color=(255, 0, 0)).save(first_path)
+            Image.new('RGB', (100, 140), color=(0, 0, 255)).save(second_path)
+            
+            assert add_bleed_border(first_path, output_dir) is True
+            assert add_bleed_border(second_path, output_dir) is True
+            
+            with Image.open(output_dir / "second.png") as output_img:
+                assert output_img.getcolors() == [(108 * 148, (0, 0, 255))]
+
+
+class TestBatchProcessing:
+    """Test processing of multiple images"""
+    
+    def test_find_image_files_recursive(self):
+        """Test that image files are found in nested folders by extension"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            nested_dir = temp_dir / "set" / "rares"
+            nested_dir.mkdir(parents=True)
+            
+            (temp_dir / "card.png").touch()
+            (nested_dir / "foil.JPG").touch()
+            (temp_dir / "notes.txt").touch()
+            (temp_dir / "jpg").touch()
+            
+            found = find_image_files(temp_dir)
+            
+            assert sorted(found) == sorted([temp_dir / "card.png", nested_dir / "foil.JPG"])
+    
+    @pytest.mark.parametrize("error", [PermissionError, FileNotFoundError, NotADirectoryError])
+    def test_find_image_files_skips_unreadable_folders(self, monkeypatch, error):
+        """Test that a folder that cannot be read is skipped instead of aborting the scan"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            locked_dir = temp_dir / "locked"
+            locked_dir.mkdir()
+            
+            (temp_dir / "card.png").touch()
+            (locked_dir / "hidden.png").touch()
+            
+            real_scandir = os.scandir
+            
+            def scandir(path):
+                if path == str(locked_dir):
+                    raise error(str(path))
+                return real_scandir(path)
+            
+            monkeypatch.setattr(os, "scandir", scandir)
+            
+            assert find_image_files(temp_dir) == [temp_dir / "card.png"]
+    
+    def test_process_images_writes_every_image(self):
+        """Test that every input image gets a bordered output"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            output_dir = temp_dir / "output"
+            output_dir.mkdir()
+            
+            image_files = []
+            for i in range(5):
+                input_path = temp_dir / f"card_{i}.png"
+                Image.new('RGB', (100, 140), color=(i * 40, 0, 0)).save(input_path)
+                image_files.append(input_path)
+            
+            process_images(image_files, output_dir)
+            
+            for input_path in image_files:
+                with Image.open(output_dir / input_path.name) as output_img:
+                    assert output_img.size == (108, 148)
+    
+    def test_process_images_reports_broken_pool(self, monkeypatch, capsys):
+        """Test that a crashed worker pool still ends with a failure summary"""
+        class BrokenExecutor:
+            def __init__(self, max_workers=None):
+                pass
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+            
+            def map(self, fn, iterable, chunksize=1):
+                yield True
+                raise BrokenProcessPool("worker died")
+        
+        monkeypatch.setattr(add_mpc_bleed, "ProcessPoolExecutor", BrokenExecutor)
+        
+        image_files = [Path(f"card_{i}.png") for i in range(5)]
+        process_images(image_files, Path("output"))
+        
+        output = capsys.readouterr().out
+        assert "worker died" in output
+        assert "Successfully processed: 1 images" in output
+        assert "Failed to process: 4 images" in output
+    
+    def test_process_images_interrupt_cancels_queued_work(self, monkeypatch):
+        """Test that Ctrl+C cancels queued images instead of waiting for them"""
+        calls = []
+        shutdowns = []
+        
+        class InterruptedExecutor:
+            def __init__(self, max_workers=None):
+                pass
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+            
+            def map(self, fn, iterable, chunksize=1):
+                for image_path in iterable:
+                    if len(calls) == 2:
+                        raise KeyboardInterrupt
+                    calls.append(image_path)
+                    yield True
+            
+            def shutdown(self, wait=True, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+        
+        monkeypatch.setattr(add_mpc_bleed, "ProcessPoolExecutor", InterruptedExecutor)
+        
+        image_files = [Path(f"card_{i}.png") for i in range(10)]
+        with pytest.raises(KeyboardInterrupt):
+            process_images(image_files, Path("output"))
+        
+        assert calls == image_files[:2]
+        assert shutdowns == [(False, True)]
+    
+    def test_process_images_caps_workers_on_windows(self, monkeypatch):
+        """Test that Windows never asks for more than 61 worker processes"""
+        requested = []
+        
+        class RecordingExecutor:
+            def __init__(self, max_workers=None):
+                requested.append(max_workers)
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+            
+            def map(self, fn, iterable, chunksize=1):
+                return [True for _ in iterable]
+        
+        monkeypatch.setattr(add_mpc_bleed, "ProcessPoolExecutor", RecordingExecutor)
+        monkeypatch.setattr(add_mpc_bleed.sys, "platform", "win32")
+        monkeypatch.setattr(add_mpc_bleed.os, "cpu_count", lambda: 128)
+        
+        process_images([Path("card.png")], Path("output"))
+        
+        assert requested == [61]
 
 
 if __name__ == "__main__":